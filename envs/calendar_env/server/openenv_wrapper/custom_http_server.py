@@ -132,7 +132,7 @@ class MCPHTTPEnvServer(HTTPEnvServer):
             )
 
             # Execute reset in thread pool (environments may use sync code)
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             observation = await loop.run_in_executor(None, self.env.reset)
 
             # Serialize observation manually
@@ -206,7 +206,7 @@ class MCPHTTPEnvServer(HTTPEnvServer):
                 }
 
             # Execute step in thread pool (environments may use sync code)
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             observation = await loop.run_in_executor(None, self.env.step, action)
 
             # Serialize observation manually
@@ -264,7 +264,7 @@ class UnityMLAgentsEnvironment(Environment):
         if not self._unity_env.behavior_specs:
             self._unity_env.step()
 
-        self._behavior_name = list(self._unity_env.behavior_specs.keys())[0]
+        self._behavior_name = next(iter(self._unity_env.behavior_specs))
         self._behavior_spec = self._unity_env.behavior_specs[self._behavior_name]
 
         # Update state
@@ -288,7 +288,7 @@ class HTTPEnvServer:
         self, func: Callable[..., Observation], *args, **kwargs
     ) -> Observation:
         """Run a synchronous function in the thread pool executor."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
 
     def _get_valid_kwargs(
@@ -346,7 +346,7 @@ class HTTPEnvServer:
 
         try:
             # Create environment in the executor thread (outside lock)
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             env = await loop.run_in_executor(executor, self._env_factory)
         except Exception as e:
             async with self._session_lock:
@@ -432,7 +432,7 @@ class HTTPEnvServer:
         if env is not None:
             if executor is not None:
                 try:
-                    loop = asyncio.get_event_loop()
+                    loop = asyncio.get_running_loop()
                     await loop.run_in_executor(executor, env.close)
                 except Exception:
                     # If executor close fails, try direct close as fallback
@@ -526,7 +526,7 @@ class HTTPEnvServer:
     ) -> Observation:
         """Run a synchronous function in the session's thread pool executor."""
         executor = self._session_executors.get(session_id, self._executor)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(executor, lambda: func(*args, **kwargs))
 
     @property
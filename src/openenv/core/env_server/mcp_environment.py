@@ -603,7 +603,7 @@ class MCPEnvironment(Environment):
         elif isinstance(action, CallToolAction):
             return await self._async_handle_call_tool(action, timeout_s=timeout_s)
         else:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             return await loop.run_in_executor(
                 None, lambda: self._step_impl(action, timeout_s=timeout_s, **kwargs)
             )
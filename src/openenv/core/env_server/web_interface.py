@@ -299,7 +299,7 @@ class WebInterfaceManager:
         This is needed for environments using sync libraries (e.g., Playwright sync API)
         that cannot be called directly from an async context.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         # Use default arguments to capture values at lambda definition time
         # to avoid closure issues with late binding
         return await loop.run_in_executor(